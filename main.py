@@ -12,25 +12,455 @@ Fonctionnalités principales :
 - Normalisation des données pour éviter les doublons
 """
 
+import functools
 import hashlib
+import hmac
 import json
 import re
 import sys
 import os
 import urllib.parse
+from collections import OrderedDict
 from datetime import datetime
-from pathlib import Path
 
 import qrcode
+from qrcode.image.pil import PilImage
 import unicodedata
-from PyQt5.QtCore import Qt, QDate, QTime, QSettings, QTimer
-from PyQt5.QtGui import QPixmap, QFont, QCursor, QIcon
+from PyQt5.QtCore import (Qt, QDate, QTime, QSettings, QTimer, QObject, QRunnable,
+                          QThreadPool, pyqtSignal, QAbstractTableModel, QModelIndex)
+from PyQt5.QtGui import QPixmap, QImage, QFont, QCursor, QIcon, qRgb
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QTabWidget, QWidget,
                              QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit,
                              QPushButton, QLabel, QTextEdit, QMessageBox,
-                             QFileDialog, QDateEdit, QTimeEdit, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QFileDialog, QDateEdit, QTimeEdit, QTableView, QHeaderView,
                              QGroupBox, QDialog)
 
+try:
+    import orjson
+except ImportError:
+    # orjson est optionnel : repli sur le module json standard
+    orjson = None
+
+# Taille en pixels d'un module (carré élémentaire) dans l'image QR générée
+QR_BOX_SIZE = 10
+
+# Destinataire et objet de l'email pré-rempli
+MAILTO_ADDRESS = "moi@handball.com"
+MAILTO_SUBJECT = "Versement IBAN"
+
+# Caractères laissés tels quels lors de l'encodage URL du lien mailto
+# (même valeur par défaut que urllib.parse.quote)
+_MAILTO_SAFE = b'/'
+
+# Début du lien mailto, constant : destinataire et objet encodés une seule fois
+_MAILTO_PREFIX = (f"mailto:{MAILTO_ADDRESS}?subject="
+                  f"{urllib.parse.quote_from_bytes(MAILTO_SUBJECT.encode('utf-8'), safe=_MAILTO_SAFE)}"
+                  f"&body=")
+
+# Feuilles de style définies une seule fois au chargement du module
+# (évite de reconstruire plusieurs Ko de CSS à chaque ouverture de fenêtre)
+_MAIN_STYLESHEET = """
+    /* === STYLE PRINCIPAL === */
+    QMainWindow {
+        background-color: #f5f5f5;
+    }
+
+    /* === TITRE PRINCIPAL === */
+    QLabel#titleLabel {
+        margin: 10px; 
+        color: #2E4057;
+    }
+
+    /* === ONGLETS === */
+    QTabWidget::pane {
+        border: 1px solid #cccccc;
+        background-color: white;
+    }
+    QTabBar::tab {
+        background-color: #e0e0e0;
+        padding: 8px 16px;
+        margin-right: 2px;
+    }
+    QTabBar::tab:selected {
+        background-color: #4CAF50;
+        color: white;
+    }
+
+    /* === BOUTONS PRIMAIRES (actions principales) === */
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 5px;
+        font-weight: bold;
+        font-size: 13px;
+        min-width: 100px;
+        min-height: 25px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:pressed {
+        background-color: #3e8e41;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+        color: #666666;
+    }
+
+    /* === BOUTONS SECONDAIRES === */
+    QPushButton#secondaryBtn {
+        background-color: #2196F3;
+        min-width: 100px;
+        min-height: 25px;
+        padding: 8px 16px;
+        font-size: 13px;
+        border-radius: 5px;
+        font-weight: bold;
+        color: white;
+        border: none;
+    }
+    QPushButton#secondaryBtn:hover {
+        background-color: #1976D2;
+    }
+    QPushButton#secondaryBtn:pressed {
+        background-color: #1565C0;
+    }
+
+    /* === BOUTONS D'ATTENTION/WARNING === */
+    QPushButton#warningBtn {
+        background-color: #FF9800;
+        min-width: 100px;
+        min-height: 25px;
+        padding: 8px 16px;
+        font-size: 13px;
+        border-radius: 5px;
+        font-weight: bold;
+        color: white;
+        border: none;
+    }
+    QPushButton#warningBtn:hover {
+        background-color: #F57C00;
+    }
+    QPushButton#warningBtn:pressed {
+        background-color: #EF6C00;
+    }
+
+    /* === BOUTONS SPÉCIAUX (vérification, génération) === */
+    QPushButton#specialBtn {
+        background-color: #2196F3;
+        min-width: 100px;
+        min-height: 25px;
+        padding: 8px 16px;
+        font-size: 13px;
+        border-radius: 5px;
+        font-weight: bold;
+        color: white;
+        border: none;
+    }
+    QPushButton#specialBtn:hover {
+        background-color: #1976D2;
+    }
+    QPushButton#specialBtn:pressed {
+        background-color: #1565C0;
+    }
+
+    /* === CHAMPS DE SAISIE === */
+    QLineEdit, QDateEdit, QTimeEdit {
+        padding: 6px;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        font-size: 13px;
+    }
+    QLineEdit:focus, QDateEdit:focus, QTimeEdit:focus {
+        border-color: #4CAF50;
+        outline: none;
+    }
+
+    /* === ZONE DE TEXTE === */
+    QTextEdit {
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        font-size: 13px;
+    }
+    QTextEdit:focus {
+        border-color: #4CAF50;
+    }
+
+    /* === TEMPLATE EMAIL === */
+    QTextEdit#emailTemplate {
+        font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
+        font-size: 13px;
+        line-height: 1.4;
+        padding: 15px;
+        border: 2px solid #ddd;
+        border-radius: 8px;
+        background-color: #ffffff;
+    }
+    QTextEdit#emailTemplate:focus {
+        border-color: #4CAF50;
+    }
+
+    /* === GROUPES === */
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #cccccc;
+        border-radius: 8px;
+        margin-top: 1ex;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+
+    /* === ZONE QR CODE === */
+    QLabel#qrLabel {
+        border: 2px dashed #ccc; 
+        background-color: #fafafa;
+    }
+
+    /* === CLÉ DE SÉCURITÉ === */
+    QLabel#keyDisplay {
+        font-family: monospace; 
+        font-size: 14px; 
+        color: #333; 
+        padding: 10px;
+    }
+
+    /* === RÉSULTAT VÉRIFICATION VALIDE === */
+    QLabel#verifyResult[state="valid"] {
+        border: 2px solid #4CAF50;
+        background-color: #e8f5e8;
+        color: #2e7d32;
+        font-size: 18px;
+        font-weight: bold;
+        border-radius: 8px;
+        padding: 20px;
+    }
+
+    /* === RÉSULTAT VÉRIFICATION INVALIDE === */
+    QLabel#verifyResult[state="invalid"] {
+        border: 2px solid #f44336;
+        background-color: #ffebee;
+        color: #c62828;
+        font-size: 18px;
+        font-weight: bold;
+        border-radius: 8px;
+        padding: 20px;
+    }
+
+    /* === RÉSULTAT VÉRIFICATION NEUTRE === */
+    QLabel#verifyResult[state="neutral"] {
+        border: 2px solid #ddd;
+        background-color: #fafafa;
+        font-size: 18px;
+        font-weight: bold;
+        border-radius: 8px;
+        padding: 30px;
+    }
+
+    /* === DÉTAILS VÉRIFICATION === */
+    QTextEdit#verifyDetails {
+        background-color: #f9f9f9;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        font-family: monospace;
+        font-size: 12px;
+        padding: 10px;
+    }
+
+    /* === INFORMATIONS VARIABLES === */
+    QLabel#variablesInfo {
+        color: #555;
+        font-size: 13px;
+        padding: 15px;
+        background-color: #f0f8ff;
+        border-radius: 4px;
+    }
+
+    /* === INSTRUCTION TEMPLATE === */
+    QLabel#templateInstruction {
+        color: #666; 
+        font-size: 11px; 
+        margin-bottom: 5px;
+    }
+
+    /* === COMPTEUR CARACTÈRES === */
+    QLabel#charCount[state="green"] {
+        color: #4caf50; 
+        font-size: 11px;
+    }
+    QLabel#charCount[state="orange"] {
+        color: #ff9800; 
+        font-size: 11px;
+    }
+    QLabel#charCount[state="red"] {
+        color: #f44336; 
+        font-size: 11px; 
+        font-weight: bold;
+    }
+
+    /* === STATISTIQUES === */
+    QLabel#stats {
+        color: #666;
+        font-size: 12px;
+    }
+"""
+
+# Style propre au QR code cliquable : le survol ne repolit que ce label
+_CLICKABLE_QR_STYLESHEET = """
+    QLabel {
+        border: 2px dashed #ccc;
+        background-color: #fafafa;
+    }
+    QLabel:hover {
+        border: 2px solid #4CAF50;
+        background-color: #f0f8f0;
+    }
+"""
+
+_QR_POPUP_STYLESHEET = """
+    QDialog {
+        background-color: #f8f9fa;
+    }
+
+    QLabel#popupTitle {
+        font-size: 24px;
+        font-weight: bold;
+        color: #2E4057;
+        margin: 10px;
+    }
+
+    QLabel#popupInstruction {
+        font-size: 16px;
+        color: #666;
+        margin: 5px 0 20px 0;
+        padding: 10px;
+        background-color: #e3f2fd;
+        border-radius: 8px;
+    }
+
+    QLabel#popupQRDisplay {
+        background-color: white;
+        border: 3px solid #4CAF50;
+        border-radius: 12px;
+        padding: 20px;
+        margin: 10px;
+    }
+
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        padding: 12px 24px;
+        border-radius: 6px;
+        font-weight: bold;
+        font-size: 14px;
+        min-width: 120px;
+        margin: 5px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:pressed {
+        background-color: #3e8e41;
+    }
+
+    QPushButton#secondaryBtn {
+        background-color: #2196F3;
+    }
+    QPushButton#secondaryBtn:hover {
+        background-color: #1976D2;
+    }
+"""
+
+_EMAIL_POPUP_STYLESHEET = """
+    QDialog {
+        background-color: #f8f9fa;
+    }
+
+    QLabel#popupTitle {
+        font-size: 24px;
+        font-weight: bold;
+        color: #2E4057;
+        margin: 10px;
+    }
+
+    QLabel#popupInstruction {
+        font-size: 16px;
+        color: #666;
+        margin: 5px 0 20px 0;
+        padding: 10px;
+        background-color: #e3f2fd;
+        border-radius: 8px;
+    }
+
+    QLabel#emailDetails {
+        font-size: 14px;
+        color: #444;
+        padding: 10px;
+        background-color: #fff3e0;
+        border-radius: 6px;
+    }
+
+    QTextEdit#emailPreview {
+        font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
+        font-size: 13px;
+        line-height: 1.4;
+        padding: 15px;
+        border: 2px solid #4CAF50;
+        border-radius: 8px;
+        background-color: #ffffff;
+    }
+
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #cccccc;
+        border-radius: 8px;
+        margin-top: 1ex;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        padding: 12px 24px;
+        border-radius: 6px;
+        font-weight: bold;
+        font-size: 14px;
+        min-width: 120px;
+        margin: 5px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:pressed {
+        background-color: #3e8e41;
+    }
+
+    QPushButton#secondaryBtn {
+        background-color: #2196F3;
+    }
+    QPushButton#secondaryBtn:hover {
+        background-color: #1976D2;
+    }
+"""
+
+# Dossier de base des ressources, déterminé une seule fois au chargement :
+# PyInstaller crée un dossier temporaire et stocke le chemin dans _MEIPASS,
+# sinon (mode développement normal) le dossier courant
+_BASE_PATH = getattr(sys, '_MEIPASS', os.path.abspath("."))
+
+@functools.lru_cache(maxsize=32)
 def resource_path(relative_path):
     """
     Obtient le chemin absolu vers une ressource, fonctionne en dev ET après build PyInstaller.
@@ -44,16 +474,390 @@ def resource_path(relative_path):
     Returns:
         str: Chemin absolu vers la ressource
     """
-    try:
-        # PyInstaller crée un dossier temporaire et stocke le chemin dans _MEIPASS
-        base_path = sys._MEIPASS
-    except AttributeError:
-        # Mode développement normal
-        base_path = os.path.abspath(".")
+    return os.path.join(_BASE_PATH, relative_path)
+
+# Icône de l'application, décodée une seule fois (voir _get_app_icon)
+_APP_ICON = None
+
+def _get_app_icon():
+    """
+    Retourne l'icône de l'application, chargée au premier appel.
+    Doit être appelée après la création de QApplication.
+
+    Returns:
+        QIcon: Icône de l'application
+    """
+    global _APP_ICON
+    if _APP_ICON is None:
+        _APP_ICON = QIcon(resource_path("qr.png"))
+    return _APP_ICON
+
+class _CombiningMarksTable(dict):
+    """
+    Table pour str.translate supprimant les marques combinantes (accents).
+    Chaque caractère n'est classé qu'une seule fois, à sa première rencontre,
+    ce qui évite de construire la table complète au démarrage.
+    """
+
+    def __missing__(self, codepoint):
+        value = None if unicodedata.category(chr(codepoint)) == 'Mn' else codepoint
+        self[codepoint] = value
+        return value
+
+_COMBINING_MARKS_TABLE = _CombiningMarksTable()
+
+def _nfd(text):
+    """
+    Décompose un texte en forme NFD, sans copie s'il l'est déjà.
+    Le test rapide (quick check) d'unicodedata évite une normalisation inutile.
+
+    Args:
+        text (str): Texte à décomposer
+
+    Returns:
+        str: Texte en forme NFD
+    """
+    if text.isascii() or unicodedata.is_normalized('NFD', text):
+        return text
+    return unicodedata.normalize('NFD', text)
+
+# Expressions régulières de normalisation compilées une seule fois
+_NONALNUM_RE = re.compile(r'[^a-z0-9\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+@functools.lru_cache(maxsize=512)
+def _normalize_team_name(text):
+    """
+    Normalise un nom d'équipe (voir ArbitreQRGenerator.normalize_string).
+    Résultats mis en cache : les mêmes noms reviennent souvent.
+
+    Args:
+        text (str): Texte à normaliser
+
+    Returns:
+        str: Texte normalisé (minuscules, sans accents, espaces multiples supprimés)
+    """
+    if not text:
+        return ""
+
+    # Suppression des espaces en début/fin et conversion en minuscules
+    text = text.strip().lower()
+
+    # Suppression des accents et caractères spéciaux
+    # Texte ASCII (cas le plus courant) : aucun accent, décomposition inutile
+    if not text.isascii():
+        text = _nfd(text).translate(_COMBINING_MARKS_TABLE)
+
+    # Suppression des caractères non-alphanumériques (sauf espaces)
+    text = _NONALNUM_RE.sub('', text)
+
+    # Remplacement des espaces multiples par un seul espace
+    text = _WHITESPACE_RE.sub(' ', text)
+
+    return text.strip()
+
+def disable_label_antialiasing(widget):
+    """
+    Désactive l'anticrénelage des labels marqués avec la propriété "noAA".
+    Réduit le coût de rendu des textes simples (instructions, clé).
+
+    Args:
+        widget (QWidget): Widget dont les labels enfants sont parcourus
+    """
+    for label in widget.findChildren(QLabel):
+        if label.property("noAA"):
+            font = label.font()
+            font.setStyleStrategy(QFont.NoAntialias | QFont.PreferBitmap)
+            label.setFont(font)
+
+@functools.lru_cache(maxsize=64)
+def _hash_security_key(normalized_equipe1, normalized_equipe2, date, heure, sel_secret_bytes):
+    """
+    Calcule la clé de sécurité SHA256 à partir de données déjà normalisées.
+    Les résultats sont mis en cache par match : une vérification répétée ne
+    refait pas le hachage. Le sel fait partie de la clé du cache, une
+    modification de SEL_SECRET ne peut donc pas renvoyer une clé périmée.
+
+    Args:
+        normalized_equipe1 (str): Nom normalisé de la première équipe
+        normalized_equipe2 (str): Nom normalisé de la deuxième équipe
+        date (str): Date du match (YYYY-MM-DD)
+        heure (str): Heure du match (HH:MM)
+        sel_secret_bytes (bytes): Suffixe ";SEL" encodé en UTF-8
+
+    Returns:
+        str: Clé de sécurité (10 premiers caractères hexadécimaux en majuscules)
+    """
+    # Construction du message à hacher avec le format standardisé
+    # "equipe1;equipe2;date;heure;SEL" (le sel est déjà encodé)
+    data_bytes = f"{normalized_equipe1};{normalized_equipe2};{date};{heure}".encode('utf-8')
+
+    # Calcul du hash SHA256 : 5 octets = 10 caractères hexadécimaux
+    return hashlib.sha256(data_bytes + sel_secret_bytes).digest()[:5].hex().upper()
+
+# Variables reconnues dans le template d'email, et accolades doublées
+# ({{ et }}) désignant une accolade littérale comme avec str.format
+_TEMPLATE_VAR_RE = re.compile(r'\{\{|\}\}|\{(EQUIPE1|EQUIPE2|DATE|HEURE|CLE)\}')
+
+def render_template(template, data):
+    """
+    Remplace les variables du template par les valeurs fournies.
+    Les accolades doublées ({{ et }}) donnent une accolade littérale, comme
+    avec str.format. Les accolades qui ne correspondent pas à une variable
+    connue (ex: {foo}) sont laissées telles quelles au lieu de provoquer une erreur.
+
+    Args:
+        template (str): Template avec variables au format {VARIABLE}
+        data (dict): Valeurs des variables EQUIPE1, EQUIPE2, DATE, HEURE et CLE
+
+    Returns:
+        str: Template rendu
+    """
+    def replace(match):
+        name = match.group(1)
+        if name is None:
+            return match.group(0)[0]  # Accolade doublée -> accolade simple
+        return str(data[name])
+
+    return _TEMPLATE_VAR_RE.sub(replace, template)
+
+def _cache_history_timestamp(entry, timestamp=None):
+    """
+    Ajoute à une entrée d'historique sa date de génération déjà analysée.
+    Les champs préfixés par "_" servent de cache et ne sont pas sauvegardés.
+
+    Args:
+        entry (dict): Entrée d'historique (modifiée sur place)
+        timestamp (datetime, optional): Date déjà connue, évite de relire "timestamp"
+
+    Returns:
+        dict: La même entrée, complétée
+    """
+    if timestamp is None:
+        timestamp = datetime.fromisoformat(entry["timestamp"])
+    # Secondes epoch entières : comparaison numérique directe dans update_stats
+    entry["_ts_epoch"] = int(timestamp.timestamp())
+    entry["_ts_display"] = timestamp.strftime("%d/%m/%Y %H:%M")
+    return entry
+
+def _dump_history_line(entry):
+    """
+    Sérialise une entrée d'historique en une ligne JSON (format NDJSON).
+    Les champs de cache (préfixe "_") sont exclus.
+
+    Args:
+        entry (dict): Entrée d'historique
+
+    Returns:
+        bytes: Ligne JSON encodée en UTF-8, terminée par un saut de ligne
+    """
+    entry = {key: value for key, value in entry.items() if not key.startswith("_")}
+    if orjson is not None:
+        return orjson.dumps(entry) + b"\n"
+    return json.dumps(entry, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b"\n"
+
+def _load_history_line(line):
+    """
+    Désérialise une ligne JSON de l'historique.
+
+    Args:
+        line (bytes): Ligne JSON encodée en UTF-8
+
+    Returns:
+        dict: Entrée d'historique
+    """
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+class CachedSettings:
+    """
+    Enveloppe de QSettings avec un cache mémoire.
+    Les écritures identiques à la dernière valeur connue sont ignorées,
+    ce qui évite un accès au registre (ou au fichier INI) à chaque frappe.
+    """
+
+    def __init__(self, organization, application):
+        self._settings = QSettings(organization, application)
+        self._cache = {}
+
+    def value(self, key, default=None):
+        """Lit une valeur, depuis le cache après la première lecture"""
+        if key in self._cache:
+            return self._cache[key]
+        if not self._settings.contains(key):
+            # Clé absente : pas de mise en cache pour ne pas figer la valeur par défaut
+            return default
+        value = self._settings.value(key, default)
+        self._cache[key] = value
+        return value
+
+    def setValue(self, key, value):
+        """Écrit une valeur uniquement si elle a changé"""
+        if key in self._cache and self._cache[key] == value:
+            return
+        self._settings.setValue(key, value)
+        self._cache[key] = value
+
+    def sync(self):
+        """Force l'écriture des paramètres en attente sur le support de stockage"""
+        self._settings.sync()
+
+def build_qr_image(payload):
+    """
+    Encode les données dans un QR code et produit son image.
+    Utilisable hors du thread principal (aucun QPixmap n'est créé).
+
+    Args:
+        payload (str): Données à encoder (lien mailto)
+
+    Returns:
+        tuple: (image PIL pour la sauvegarde PNG, QImage pour l'affichage)
+    """
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=QR_BOX_SIZE,
+        border=4,
+    )
+    qr.add_data(payload)
+    qr.make(fit=True)
+
+    # === Création de l'image ===
+    qr_image = qr.make_image(image_factory=PilImage, fill_color="black", back_color="white")
+
+    # === Conversion directe en mémoire (sans fichier PNG temporaire) ===
+    # Le QR code est binaire : image 1 bit par pixel, lignes alignées à l'octet
+    pil_image = qr_image.convert("1")
+    data = pil_image.tobytes()
+    mono = QImage(data, pil_image.width, pil_image.height, (pil_image.width + 7) // 8,
+                  QImage.Format_Mono)
+    mono.setColorTable([qRgb(0, 0, 0), qRgb(255, 255, 255)])  # 0 = noir, 1 = blanc (PIL)
+
+    # Niveaux de gris 8 bits pour l'affichage : la mise à l'échelle lissée reste
+    # possible avec 3 fois moins de données qu'en RGB (nouveau tampon indépendant de `data`)
+    return qr_image, mono.convertToFormat(QImage.Format_Grayscale8)
+
+class QRGenWorkerSignals(QObject):
+    """Signaux de QRGenWorker (un QRunnable ne peut pas émettre de signaux)"""
+
+    # object : image PIL et données du match transmises par référence (sans QVariant)
+    finished = pyqtSignal(QImage, object, object)
+    failed = pyqtSignal(str)
+
+class QRGenWorker(QRunnable):
+    """
+    Tâche de fond générant l'image du QR code.
+    L'encodage qrcode (Python pur) ne bloque plus l'interface.
+    """
+
+    def __init__(self, payload, match_data):
+        super().__init__()
+        self.payload = payload
+        self.match_data = match_data
+        self.signals = QRGenWorkerSignals()
+
+    def run(self):
+        """Génère l'image et transmet le résultat au thread principal"""
+        try:
+            qr_image, qimage = build_qr_image(self.payload)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(qimage, qr_image, self.match_data)
+
+class HistoryLoaderSignals(QObject):
+    """Signaux de HistoryLoader (un QRunnable ne peut pas émettre de signaux)"""
+
+    # object : la liste est transmise par référence, sans conversion QVariantList
+    loaded = pyqtSignal(object, bool)
+
+class HistoryLoader(QRunnable):
+    """
+    Tâche de fond chargeant l'historique des générations.
+    Évite de bloquer l'affichage de la fenêtre pendant la lecture du fichier.
+    """
+
+    def __init__(self, load_function):
+        super().__init__()
+        self.load_function = load_function
+        self.signals = HistoryLoaderSignals()
+
+    def run(self):
+        """Charge l'historique et transmet le résultat au thread principal"""
+        self.signals.loaded.emit(*self.load_function())
+
+class HistoryModel(QAbstractTableModel):
+    """
+    Modèle de l'historique des générations pour un QTableView.
+    Les cellules sont calculées à la demande : seules les lignes visibles sont lues.
+    Les entrées sont affichées en ordre inverse (plus récent en premier).
+
+    SÉCURITÉ: La clé de sécurité n'est jamais exposée par le modèle.
+    """
+
+    HEADERS = ["Date/Heure Génération", "Équipe 1", "Équipe 2", "Match (Date/Heure)"]
+
+    def __init__(self, entries, parent=None):
+        super().__init__(parent)
+        self._entries = entries
 
-    full_path = os.path.join(base_path, relative_path)
+    def set_entries(self, entries):
+        """
+        Remplace la liste des entrées affichées.
 
-    return full_path
+        Args:
+            entries (list): Entrées d'historique (ordre chronologique)
+        """
+        self.beginResetModel()
+        self._entries = entries
+        self.endResetModel()
+
+    def append_entry(self, entry):
+        """
+        Ajoute une entrée à la liste et l'insère en tête de la vue,
+        sans réinitialiser les autres lignes.
+
+        Args:
+            entry (dict): Nouvelle entrée d'historique
+        """
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._entries.append(entry)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+
+        entry = self._entries[len(self._entries) - 1 - index.row()]
+        column = index.column()
+
+        # Colonne 0: Date/Heure de génération
+        if column == 0:
+            return entry["_ts_display"]
+        # Colonne 1: Équipe 1
+        if column == 1:
+            return entry["equipe1"]
+        # Colonne 2: Équipe 2
+        if column == 2:
+            return entry["equipe2"]
+        # Colonne 3: Date et heure du match
+        return f"{entry['date']} {entry['heure']}"
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
 
 class QRCodePopup(QDialog):
     """
@@ -64,12 +868,22 @@ class QRCodePopup(QDialog):
     def __init__(self, qr_pixmap, parent=None):
         super().__init__(parent)
         self.qr_pixmap = qr_pixmap
+        # Version réduite à 1 pixel par module : tout agrandissement d'un
+        # facteur entier reste net avec une interpolation au plus proche voisin
+        self._base_pixmap = None
+        if qr_pixmap:
+            cells = qr_pixmap.width() // QR_BOX_SIZE
+            self._base_pixmap = qr_pixmap.scaled(
+                cells, cells, Qt.IgnoreAspectRatio, Qt.FastTransformation
+            )
+        self._last_qr_scale = None  # Dernier affichage appliqué : (taille en pixels, ratio)
         self.init_ui()
 
     def init_ui(self):
         """Initialise l'interface de la popup plein écran"""
         # Configuration de la fenêtre en plein écran
         self.setWindowTitle("QR Code - Vue Agrandie")
+        self.setWindowIcon(_get_app_icon())
         self.setWindowFlags(Qt.Dialog | Qt.WindowMaximizeButtonHint | Qt.WindowCloseButtonHint)
         self.setModal(True)
 
@@ -83,6 +897,7 @@ class QRCodePopup(QDialog):
         instruction = QLabel("💡 Scannez ce QR code avec votre téléphone pour ouvrir l'email pré-rempli")
         instruction.setAlignment(Qt.AlignCenter)
         instruction.setObjectName("popupInstruction")
+        instruction.setProperty("noAA", True)
         instruction.setWordWrap(True)
         header_layout.addWidget(instruction)
 
@@ -123,60 +938,8 @@ class QRCodePopup(QDialog):
 
     def apply_popup_styles(self):
         """Applique les styles spécifiques à la popup"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #f8f9fa;
-            }
-            
-            QLabel#popupTitle {
-                font-size: 24px;
-                font-weight: bold;
-                color: #2E4057;
-                margin: 10px;
-            }
-            
-            QLabel#popupInstruction {
-                font-size: 16px;
-                color: #666;
-                margin: 5px 0 20px 0;
-                padding: 10px;
-                background-color: #e3f2fd;
-                border-radius: 8px;
-            }
-            
-            QLabel#popupQRDisplay {
-                background-color: white;
-                border: 3px solid #4CAF50;
-                border-radius: 12px;
-                padding: 20px;
-                margin: 10px;
-            }
-            
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 12px 24px;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 14px;
-                min-width: 120px;
-                margin: 5px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3e8e41;
-            }
-            
-            QPushButton#secondaryBtn {
-                background-color: #2196F3;
-            }
-            QPushButton#secondaryBtn:hover {
-                background-color: #1976D2;
-            }
-        """)
+        self.setStyleSheet(_QR_POPUP_STYLESHEET)
+        disable_label_antialiasing(self)
 
     def update_qr_display(self):
         """Met à jour l'affichage du QR code selon la taille de la fenêtre"""
@@ -192,10 +955,26 @@ class QRCodePopup(QDialog):
             available_size = min(display_size.width() - 60, display_size.height() - 60)
             qr_size = max(300, min(available_size, 800))
 
-        # Redimensionnement et affichage
-        scaled_pixmap = self.qr_pixmap.scaled(
-            qr_size, qr_size, Qt.KeepAspectRatio, Qt.SmoothTransformation
+        # Taille en pixels physiques (écrans HiDPI) : Qt n'a plus à
+        # réagrandir le pixmap au moment de l'affichage
+        dpr = self.devicePixelRatioF()
+        qr_size_px = int(qr_size * dpr)
+
+        # Arrondi à un multiple entier du nombre de modules (modules nets)
+        cells = self._base_pixmap.width()
+        qr_size_px = max(cells, (qr_size_px // cells) * cells)
+
+        # Taille et ratio inchangés : rien à recalculer (le ratio détermine
+        # la taille logique affichée, ex: changement d'écran)
+        if (qr_size_px, dpr) == self._last_qr_scale:
+            return
+        self._last_qr_scale = (qr_size_px, dpr)
+
+        # Redimensionnement au plus proche voisin (adapté aux modules noir/blanc)
+        scaled_pixmap = self._base_pixmap.scaled(
+            qr_size_px, qr_size_px, Qt.KeepAspectRatio, Qt.FastTransformation
         )
+        scaled_pixmap.setDevicePixelRatio(dpr)
         self.qr_display.setPixmap(scaled_pixmap)
 
     def toggle_fullscreen(self):
@@ -240,6 +1019,7 @@ class EmailTemplatePopup(QDialog):
     def init_ui(self):
         """Initialise l'interface de la popup de test template"""
         self.setWindowTitle("Test du Template Email")
+        self.setWindowIcon(_get_app_icon())
         self.setWindowFlags(Qt.Dialog | Qt.WindowMaximizeButtonHint | Qt.WindowCloseButtonHint)
         self.setModal(True)
         self.resize(800, 600)
@@ -254,6 +1034,7 @@ class EmailTemplatePopup(QDialog):
         instruction = QLabel("💡 Voici comment l'email apparaîtra avec des données d'exemple")
         instruction.setAlignment(Qt.AlignCenter)
         instruction.setObjectName("popupInstruction")
+        instruction.setProperty("noAA", True)
         instruction.setWordWrap(True)
         header_layout.addWidget(instruction)
 
@@ -264,9 +1045,9 @@ class EmailTemplatePopup(QDialog):
         email_info_layout = QVBoxLayout(email_info_group)
 
         email_details = QLabel(f"""
-<b>À :</b> moi@handball.com<br>
-<b>Objet :</b> Versement IBAN<br>
-<b>Variables utilisées :</b> {', '.join([f'{{{k}}}' for k in self.test_data.keys()])}
+<b>À :</b> {MAILTO_ADDRESS}<br>
+<b>Objet :</b> {MAILTO_SUBJECT}<br>
+<b>Variables utilisées :</b> {', '.join(map('{{{}}}'.format, self.test_data))}
         """)
         email_details.setObjectName("emailDetails")
         email_details.setWordWrap(True)
@@ -285,7 +1066,7 @@ class EmailTemplatePopup(QDialog):
 
         # Générer et afficher le contenu
         try:
-            rendered_content = self.template_content.format(**self.test_data)
+            rendered_content = render_template(self.template_content, self.test_data)
             self.email_preview.setPlainText(rendered_content)
         except Exception as e:
             self.email_preview.setPlainText(f"❌ Erreur dans le template :\n{str(e)}")
@@ -316,83 +1097,8 @@ class EmailTemplatePopup(QDialog):
 
     def apply_popup_styles(self):
         """Applique les styles spécifiques à la popup de template"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #f8f9fa;
-            }
-            
-            QLabel#popupTitle {
-                font-size: 24px;
-                font-weight: bold;
-                color: #2E4057;
-                margin: 10px;
-            }
-            
-            QLabel#popupInstruction {
-                font-size: 16px;
-                color: #666;
-                margin: 5px 0 20px 0;
-                padding: 10px;
-                background-color: #e3f2fd;
-                border-radius: 8px;
-            }
-            
-            QLabel#emailDetails {
-                font-size: 14px;
-                color: #444;
-                padding: 10px;
-                background-color: #fff3e0;
-                border-radius: 6px;
-            }
-            
-            QTextEdit#emailPreview {
-                font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-                font-size: 13px;
-                line-height: 1.4;
-                padding: 15px;
-                border: 2px solid #4CAF50;
-                border-radius: 8px;
-                background-color: #ffffff;
-            }
-            
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #cccccc;
-                border-radius: 8px;
-                margin-top: 1ex;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 12px 24px;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 14px;
-                min-width: 120px;
-                margin: 5px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3e8e41;
-            }
-            
-            QPushButton#secondaryBtn {
-                background-color: #2196F3;
-            }
-            QPushButton#secondaryBtn:hover {
-                background-color: #1976D2;
-            }
-        """)
+        self.setStyleSheet(_EMAIL_POPUP_STYLESHEET)
+        disable_label_antialiasing(self)
 
     def keyPressEvent(self, event):
         """Gestion des touches clavier"""
@@ -414,6 +1120,7 @@ class ClickableQRLabel(QLabel):
         super().__init__(parent)
         self.parent_window = parent
         self.setObjectName("clickableQRLabel")
+        self.setStyleSheet(_CLICKABLE_QR_STYLESHEET)
 
     def enterEvent(self, event):
         """Change le curseur en loupe au survol"""
@@ -463,17 +1170,26 @@ class ArbitreQRGenerator(QMainWindow):
         super().__init__()
 
         # Icone de l'application
-        self.setWindowIcon(QIcon(resource_path("qr.png")))
+        self.setWindowIcon(_get_app_icon())
 
         # Configuration du sel secret pour le hachage de sécurité
         self.SEL_SECRET = "HANDBALL_ARBITRE_2025_SECRET_SALT"
+        # Suffixe ";SEL" encodé une seule fois (ajouté en fin de message à hacher)
+        self._sel_secret_bytes = (";" + self.SEL_SECRET).encode('utf-8')
 
         # Configuration QSettings pour la sauvegarde des paramètres utilisateur
-        self.settings = QSettings("HandballApp", "ArbitreQRGenerator")
-
-        # Fichier d'historique des générations
-        self.history_file = "qr_history.json"
-        self.generation_history = self.load_history()
+        # (avec cache mémoire pour éviter les écritures redondantes)
+        self.settings = CachedSettings("HandballApp", "ArbitreQRGenerator")
+
+        # Fichier d'historique des générations (une entrée JSON par ligne)
+        # Les nouvelles entrées sont ajoutées en fin de fichier sans tout réécrire
+        self.history_file = "qr_history.ndjson"
+        self.legacy_history_file = "qr_history.json"
+        self._history_handle = None
+        self._history_dirty = False  # Réécriture complète de l'historique en attente
+        self._history_cleared = False  # Historique vidé par l'utilisateur
+        # Chargé en arrière-plan après l'initialisation (voir _on_history_loaded)
+        self.generation_history = []
 
         # Template d'email par défaut avec variables remplaçables
         self.default_email_template = """Bonjour,
@@ -496,14 +1212,46 @@ Merci."""
         # IMPORTANT: Timer créé AVANT init_ui() car les connecteurs l'utilisent
         # Timer pour la sauvegarde différée (évite de sauvegarder à chaque frappe)
         self.save_timer = QTimer()
-        self.save_timer.timeout.connect(self.save_current_settings)
+        self.save_timer.timeout.connect(self.save_pending_changes)
         self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(500)  # Sauvegarde 500ms après la première modification
+
+        # Timer pour la mise à jour différée du compteur de caractères du template
+        self._char_count_timer = QTimer(self)
+        self._char_count_timer.setSingleShot(True)
+        self._char_count_timer.setInterval(120)
+        self._char_count_timer.timeout.connect(self.update_char_count)
+        self._settings_dirty = False  # Formulaire modifié depuis la dernière sauvegarde
+        self._template_dirty = False  # Template modifié depuis la dernière sauvegarde
+        self._last_char_count = -1
+        self._last_char_bucket = None
+
+        # QR code courant (aucun tant que rien n'a été généré)
+        self.current_qr_pixmap = None
+        self.current_qr_qimage = None
+
+        # État de la mise à l'échelle du QR code affiché
+        self.qr_module_count = 0  # Modules par côté (marge comprise) du QR code courant
+        self._last_qr_size = None  # Dernière taille d'affichage appliquée
+        self._scaled_cache = {}  # Pixmaps déjà mises à l'échelle : taille -> QPixmap
+        # QR codes déjà générés (LRU) : lien mailto -> (QImage, image PIL)
+        # Les paramètres d'encodage sont fixes, le lien suffit comme clé
+        self._qr_cache = OrderedDict()
 
         # Initialisation de l'interface utilisateur
         self.init_ui()
 
         # Chargement automatique des derniers paramètres sauvegardés
+        # (les valeurs restaurées sont déjà sur le disque : rien à resauvegarder)
         self.load_settings()
+        self.save_timer.stop()
+        self._settings_dirty = False
+        self._template_dirty = False
+
+        # Chargement de l'historique hors du thread de l'interface
+        self._history_loader = HistoryLoader(self.load_history)
+        self._history_loader.signals.loaded.connect(self._on_history_loaded)
+        QThreadPool.globalInstance().start(self._history_loader)
 
     def init_ui(self):
         """Initialise l'interface utilisateur avec tous les onglets"""
@@ -520,288 +1268,65 @@ Merci."""
         self.tab_widget = QTabWidget()
         layout.addWidget(self.tab_widget)
 
-        # Création de tous les onglets
-        self.create_generation_tab()      # Onglet 1: Génération de QR Code
-        self.create_verification_tab()    # Onglet 2: Vérification de clé
-        self.create_template_tab()        # Onglet 3: Template Email
-        self.create_history_tab()         # Onglet 4: Historique des générations
+        # Widgets des onglets construits à la demande
+        self.history_model = None
+
+        # Création des onglets
+        # Les onglets Vérification et Historique ne sont construits qu'à leur
+        # première ouverture ; le template est nécessaire dès le démarrage
+        # (chargement des paramètres et génération du lien mailto)
+        self.tab_widget.addTab(self.create_generation_tab(), "🔗 Génération QR Code")  # Onglet 1
+        self.tab_widget.addTab(QWidget(), "✅ Vérification Clé")                       # Onglet 2
+        self.tab_widget.addTab(self.create_template_tab(), "📧 Template Email")        # Onglet 3
+        self.tab_widget.addTab(QWidget(), "📚 Historique")                             # Onglet 4
+
+        self._lazy_tabs = {
+            1: self.create_verification_tab,
+            3: self.create_history_tab,
+        }
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
 
         # Application du style CSS
         self.apply_styles()
 
+    def _ensure_tab_built(self, index):
+        """
+        Construit un onglet différé lors de sa première ouverture.
+
+        Args:
+            index (int): Index de l'onglet sélectionné
+        """
+        builder = self._lazy_tabs.pop(index, None)
+        if builder is None:
+            return
+
+        title = self.tab_widget.tabText(index)
+        placeholder = self.tab_widget.widget(index)
+
+        # Remplacement du widget provisoire sans redéclencher currentChanged
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, builder(), title)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+
+        placeholder.deleteLater()
+
     def apply_styles(self):
         """Applique les styles CSS harmonisés à l'interface"""
-        self.setStyleSheet("""
-            /* === STYLE PRINCIPAL === */
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            
-            /* === TITRE PRINCIPAL === */
-            QLabel#titleLabel {
-                margin: 10px; 
-                color: #2E4057;
-            }
-            
-            /* === ONGLETS === */
-            QTabWidget::pane {
-                border: 1px solid #cccccc;
-                background-color: white;
-            }
-            QTabBar::tab {
-                background-color: #e0e0e0;
-                padding: 8px 16px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: #4CAF50;
-                color: white;
-            }
-            
-            /* === BOUTONS PRIMAIRES (actions principales) === */
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 13px;
-                min-width: 100px;
-                min-height: 25px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3e8e41;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-            
-            /* === BOUTONS SECONDAIRES === */
-            QPushButton#secondaryBtn {
-                background-color: #2196F3;
-                min-width: 100px;
-                min-height: 25px;
-                padding: 8px 16px;
-                font-size: 13px;
-                border-radius: 5px;
-                font-weight: bold;
-                color: white;
-                border: none;
-            }
-            QPushButton#secondaryBtn:hover {
-                background-color: #1976D2;
-            }
-            QPushButton#secondaryBtn:pressed {
-                background-color: #1565C0;
-            }
-            
-            /* === BOUTONS D'ATTENTION/WARNING === */
-            QPushButton#warningBtn {
-                background-color: #FF9800;
-                min-width: 100px;
-                min-height: 25px;
-                padding: 8px 16px;
-                font-size: 13px;
-                border-radius: 5px;
-                font-weight: bold;
-                color: white;
-                border: none;
-            }
-            QPushButton#warningBtn:hover {
-                background-color: #F57C00;
-            }
-            QPushButton#warningBtn:pressed {
-                background-color: #EF6C00;
-            }
-            
-            /* === BOUTONS SPÉCIAUX (vérification, génération) === */
-            QPushButton#specialBtn {
-                background-color: #2196F3;
-                min-width: 100px;
-                min-height: 25px;
-                padding: 8px 16px;
-                font-size: 13px;
-                border-radius: 5px;
-                font-weight: bold;
-                color: white;
-                border: none;
-            }
-            QPushButton#specialBtn:hover {
-                background-color: #1976D2;
-            }
-            QPushButton#specialBtn:pressed {
-                background-color: #1565C0;
-            }
-            
-            /* === CHAMPS DE SAISIE === */
-            QLineEdit, QDateEdit, QTimeEdit {
-                padding: 6px;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                font-size: 13px;
-            }
-            QLineEdit:focus, QDateEdit:focus, QTimeEdit:focus {
-                border-color: #4CAF50;
-                outline: none;
-            }
-            
-            /* === ZONE DE TEXTE === */
-            QTextEdit {
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                font-size: 13px;
-            }
-            QTextEdit:focus {
-                border-color: #4CAF50;
-            }
-            
-            /* === TEMPLATE EMAIL === */
-            QTextEdit#emailTemplate {
-                font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-                font-size: 13px;
-                line-height: 1.4;
-                padding: 15px;
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                background-color: #ffffff;
-            }
-            QTextEdit#emailTemplate:focus {
-                border-color: #4CAF50;
-            }
-            
-            /* === GROUPES === */
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #cccccc;
-                border-radius: 8px;
-                margin-top: 1ex;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            
-            /* === ZONE QR CODE === */
-            QLabel#qrLabel {
-                border: 2px dashed #ccc; 
-                background-color: #fafafa;
-            }
-            
-            /* === QR CODE CLIQUABLE === */
-            QLabel#clickableQRLabel {
-                border: 2px dashed #ccc; 
-                background-color: #fafafa;
-                transition: all 0.3s ease;
-            }
-            QLabel#clickableQRLabel:hover {
-                border: 2px solid #4CAF50;
-                background-color: #f0f8f0;
-                border-style: solid;
-            }
-            
-            /* === CLÉ DE SÉCURITÉ === */
-            QLabel#keyDisplay {
-                font-family: monospace; 
-                font-size: 14px; 
-                color: #333; 
-                padding: 10px;
-            }
-            
-            /* === RÉSULTAT VÉRIFICATION VALIDE === */
-            QLabel#verifyValid {
-                border: 2px solid #4CAF50;
-                background-color: #e8f5e8;
-                color: #2e7d32;
-                font-size: 18px;
-                font-weight: bold;
-                border-radius: 8px;
-                padding: 20px;
-            }
-            
-            /* === RÉSULTAT VÉRIFICATION INVALIDE === */
-            QLabel#verifyInvalid {
-                border: 2px solid #f44336;
-                background-color: #ffebee;
-                color: #c62828;
-                font-size: 18px;
-                font-weight: bold;
-                border-radius: 8px;
-                padding: 20px;
-            }
-            
-            /* === RÉSULTAT VÉRIFICATION NEUTRE === */
-            QLabel#verifyNeutral {
-                border: 2px solid #ddd;
-                background-color: #fafafa;
-                font-size: 18px;
-                font-weight: bold;
-                border-radius: 8px;
-                padding: 30px;
-            }
-            
-            /* === DÉTAILS VÉRIFICATION === */
-            QTextEdit#verifyDetails {
-                background-color: #f9f9f9;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                font-family: monospace;
-                font-size: 12px;
-                padding: 10px;
-            }
-            
-            /* === INFORMATIONS VARIABLES === */
-            QLabel#variablesInfo {
-                color: #555;
-                font-size: 13px;
-                padding: 15px;
-                background-color: #f0f8ff;
-                border-radius: 4px;
-            }
-            
-            /* === INSTRUCTION TEMPLATE === */
-            QLabel#templateInstruction {
-                color: #666; 
-                font-size: 11px; 
-                margin-bottom: 5px;
-            }
-            
-            /* === COMPTEUR CARACTÈRES === */
-            QLabel#charCountGreen {
-                color: #4caf50; 
-                font-size: 11px;
-            }
-            QLabel#charCountOrange {
-                color: #ff9800; 
-                font-size: 11px;
-            }
-            QLabel#charCountRed {
-                color: #f44336; 
-                font-size: 11px; 
-                font-weight: bold;
-            }
-            
-            /* === STATISTIQUES === */
-            QLabel#stats {
-                color: #666;
-                font-size: 12px;
-            }
-        """)
+        self.setStyleSheet(_MAIN_STYLESHEET)
+        disable_label_antialiasing(self)
 
     def create_generation_tab(self):
         """
         Crée l'onglet de génération de QR Code.
         Contient uniquement le formulaire et l'affichage du QR code.
         Layout optimisé : formulaire taille minimale + QR code extensible.
+
+        Returns:
+            QWidget: Widget de l'onglet
         """
         tab = QWidget()
-        self.tab_widget.addTab(tab, "🔗 Génération QR Code")
 
         layout = QVBoxLayout(tab)
 
@@ -871,6 +1396,7 @@ Merci."""
         self.key_display = QLabel()
         self.key_display.setAlignment(Qt.AlignCenter)
         self.key_display.setObjectName("keyDisplay")
+        self.key_display.setProperty("noAA", True)
         self.key_display.setSizePolicy(self.key_display.sizePolicy().Preferred, self.key_display.sizePolicy().Fixed)
         qr_layout.addWidget(self.key_display)
 
@@ -889,6 +1415,8 @@ Merci."""
         # Ajout du groupe QR avec stretch = 1 pour qu'il prenne tout l'espace restant
         layout.addWidget(qr_group, 1)
 
+        return tab
+
     def create_verification_tab(self):
         """
         Crée l'onglet de vérification des clés de sécurité.
@@ -897,9 +1425,11 @@ Merci."""
         car les clés ne sont affichées nulle part ailleurs dans l'application.
         Il est essentiel pour valider les emails reçus des arbitres.
         Layout optimisé pour utiliser tout l'espace disponible.
+
+        Returns:
+            QWidget: Widget de l'onglet
         """
         tab = QWidget()
-        self.tab_widget.addTab(tab, "✅ Vérification Clé")
 
         layout = QVBoxLayout(tab)
 
@@ -957,7 +1487,8 @@ Merci."""
         self.verification_result = QLabel()
         self.verification_result.setAlignment(Qt.AlignCenter)
         self.verification_result.setMinimumHeight(150)  # Plus grand qu'avant (120 → 150)
-        self.verification_result.setObjectName("verifyNeutral")
+        self.verification_result.setObjectName("verifyResult")
+        self.verification_result.setProperty("state", "neutral")
         self.verification_result.setText("Entrez les données du match et la clé à vérifier")
         result_layout.addWidget(self.verification_result)
 
@@ -972,14 +1503,18 @@ Merci."""
         # Le groupe résultat prend tout l'espace restant avec stretch = 1
         layout.addWidget(result_group, 1)
 
+        return tab
+
     def create_template_tab(self):
         """
         Crée l'onglet dédié à la configuration du template d'email.
         Permet de personnaliser le contenu de l'email généré.
         Layout optimisé pour une édition confortable du template.
+
+        Returns:
+            QWidget: Widget de l'onglet
         """
         tab = QWidget()
-        self.tab_widget.addTab(tab, "📧 Template Email")
 
         layout = QVBoxLayout(tab)
 
@@ -1037,7 +1572,8 @@ Merci."""
 
         # Indicateur de caractères
         self.char_count_label = QLabel("Caractères: 0")
-        self.char_count_label.setObjectName("charCountGreen")
+        self.char_count_label.setObjectName("charCount")
+        self.char_count_label.setProperty("state", "green")
         template_btn_layout.addWidget(self.char_count_label)
 
         template_btn_layout.addStretch()
@@ -1056,13 +1592,17 @@ Merci."""
         # Mise à jour initiale du compteur de caractères
         self.update_char_count()
 
+        return tab
+
     def create_history_tab(self):
         """
         Crée l'onglet d'historique des générations de QR codes.
         Affiche un tableau avec toutes les générations passées.
+
+        Returns:
+            QWidget: Widget de l'onglet
         """
         tab = QWidget()
-        self.tab_widget.addTab(tab, "📚 Historique")
 
         layout = QVBoxLayout(tab)
 
@@ -1087,11 +1627,10 @@ Merci."""
         # SÉCURITÉ: Les clés ne sont volontairement PAS affichées dans l'historique
         # pour éviter qu'elles soient visibles et réutilisables par des tiers
         # L'onglet vérification reste le seul moyen de valider une clé reçue
-        self.history_table = QTableWidget()
-        self.history_table.setColumnCount(4)  # Suppression de la colonne clé pour la sécurité
-        self.history_table.setHorizontalHeaderLabels([
-            "Date/Heure Génération", "Équipe 1", "Équipe 2", "Match (Date/Heure)"
-        ])
+        # Vue sur un modèle : les cellules ne sont pas recréées à chaque rafraîchissement
+        self.history_model = HistoryModel(self.generation_history, self)
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_model)  # 4 colonnes : pas de colonne clé
 
         # Configuration de la table pour un affichage optimal (sans colonne clé)
         header = self.history_table.horizontalHeader()
@@ -1115,6 +1654,8 @@ Merci."""
         # Chargement initial de l'historique
         self.refresh_history()
 
+        return tab
+
     def normalize_string(self, text):
         """
         Normalise une chaîne de caractères pour éviter les doublons.
@@ -1125,59 +1666,59 @@ Merci."""
         Returns:
             str: Texte normalisé (minuscules, sans accents, espaces multiples supprimés)
         """
-        if not text:
-            return ""
-
-        # Suppression des espaces en début/fin et conversion en minuscules
-        text = text.strip().lower()
-
-        # Suppression des accents et caractères spéciaux
-        text = unicodedata.normalize('NFD', text)
-        text = ''.join(c for c in text if unicodedata.category(c) != 'Mn')
-
-        # Suppression des caractères non-alphanumériques (sauf espaces)
-        text = re.sub(r'[^a-z0-9\s]', '', text)
-
-        # Remplacement des espaces multiples par un seul espace
-        text = re.sub(r'\s+', ' ', text)
-
-        return text.strip()
+        return _normalize_team_name(text)
 
     def on_form_change(self):
         """
         Appelée à chaque modification d'un champ du formulaire.
-        Déclenche une sauvegarde différée des paramètres.
+        Déclenche une sauvegarde différée des paramètres si aucune n'est en attente.
         """
-        # Arrêt du timer précédent et redémarrage pour éviter de sauvegarder trop souvent
-        self.save_timer.stop()
-        self.save_timer.start(500)  # Sauvegarde après 500ms d'inactivité
+        self._settings_dirty = True
+
+        # Une seule sauvegarde programmée à la fois : les frappes suivantes
+        # sont regroupées dans la sauvegarde déjà en attente
+        if not self.save_timer.isActive():
+            self.save_timer.start()
 
     def on_template_change(self):
         """
         Appelée à chaque modification du template email.
         Déclenche une sauvegarde différée du template et met à jour le compteur.
         """
+        self._template_dirty = True
         self.on_form_change()  # Utilise le même mécanisme de sauvegarde différée
-        self.update_char_count()  # Met à jour le compteur de caractères
+        self._char_count_timer.start()  # Compteur mis à jour après une courte pause de frappe
 
     def update_char_count(self):
         """
         Met à jour le compteur de caractères du template.
         """
         if hasattr(self, 'email_template') and hasattr(self, 'char_count_label'):
-            char_count = len(self.email_template.toPlainText())
-            self.char_count_label.setText(f"Caractères: {char_count:,}")
+            # Longueur lue sur le document, sans extraire tout le texte
+            # (characterCount inclut le séparateur du dernier paragraphe)
+            char_count = self.email_template.document().characterCount() - 1
 
-            # Changement de classe CSS selon la longueur
+            # Longueur inchangée (ex: remplacement d'un caractère) : rien à faire
+            if char_count == self._last_char_count:
+                return
+            self._last_char_count = char_count
+            self.char_count_label.setText(f"Caractères: {char_count}")
+
+            # Changement d'état CSS selon la longueur
             if char_count > 1000:
-                self.char_count_label.setObjectName("charCountRed")
+                bucket = "red"
             elif char_count > 500:
-                self.char_count_label.setObjectName("charCountOrange")
+                bucket = "orange"
             else:
-                self.char_count_label.setObjectName("charCountGreen")
+                bucket = "green"
+
+            # Style réappliqué uniquement lors d'un changement de seuil
+            if bucket == self._last_char_bucket:
+                return
+            self._last_char_bucket = bucket
+            self.char_count_label.setProperty("state", bucket)
 
-            # Réappliquer le style après changement d'objectName
-            self.char_count_label.style().unpolish(self.char_count_label)
+            # Réappliquer le style du seul label après changement de propriété
             self.char_count_label.style().polish(self.char_count_label)
 
     def generate_security_key(self, equipe1, equipe2, date, heure):
@@ -1197,15 +1738,8 @@ Merci."""
         normalized_equipe1 = self.normalize_string(equipe1)
         normalized_equipe2 = self.normalize_string(equipe2)
 
-        # Construction de la chaîne à hacher avec le format standardisé
-        data_string = f"{normalized_equipe1};{normalized_equipe2};{date};{heure};{self.SEL_SECRET}"
-
-        # Calcul du hash SHA256
-        hash_object = hashlib.sha256(data_string.encode('utf-8'))
-        hash_hex = hash_object.hexdigest()
-
-        # Retour des 10 premiers caractères en majuscules
-        return hash_hex[:10].upper()
+        return _hash_security_key(normalized_equipe1, normalized_equipe2, date, heure,
+                                  self._sel_secret_bytes)
 
     def create_mailto_link(self, equipe1, equipe2, date, heure, security_key):
         """
@@ -1221,21 +1755,20 @@ Merci."""
         Returns:
             str: Lien mailto formaté
         """
-        subject = "Versement IBAN"
-
         # Utilisation du template personnalisé avec remplacement des variables
         template = self.email_template.toPlainText()
-        body = template.format(
-            EQUIPE1=equipe1.strip(),  # Utilisation des noms originaux (non normalisés) pour l'affichage
-            EQUIPE2=equipe2.strip(),
-            DATE=date,
-            HEURE=heure,
-            CLE=security_key
-        )
+        body = render_template(template, {
+            'EQUIPE1': equipe1.strip(),  # Utilisation des noms originaux (non normalisés) pour l'affichage
+            'EQUIPE2': equipe2.strip(),
+            'DATE': date,
+            'HEURE': heure,
+            'CLE': security_key
+        })
 
         # Encodage URL pour compatibilité avec les clients email
-        mailto_link = f"mailto:moi@handball.com?subject={urllib.parse.quote(subject)}&body={urllib.parse.quote(body)}"
-        return mailto_link
+        # (seul le corps varie : le début du lien est précalculé)
+        quoted_body = urllib.parse.quote_from_bytes(body.encode('utf-8'), safe=_MAILTO_SAFE)
+        return _MAILTO_PREFIX + quoted_body
 
     def generate_qr_code(self):
         """
@@ -1263,43 +1796,76 @@ Merci."""
         # === Création du lien mailto ===
         mailto_link = self.create_mailto_link(equipe1_raw, equipe2_raw, date, heure, security_key)
 
-        # === Génération du QR Code ===
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(mailto_link)
-        qr.make(fit=True)
+        # === Génération du QR Code en arrière-plan ===
+        # L'interface reste réactive pendant l'encodage ; la suite est traitée
+        # dans _on_qr_generated une fois l'image prête
+        match_data = {
+            "equipe1": equipe1_raw,
+            "equipe2": equipe2_raw,
+            "date": date,
+            "heure": heure,
+            "security_key": security_key,
+            "mailto_link": mailto_link,
+        }
 
-        # === Création et sauvegarde temporaire de l'image ===
-        qr_image = qr.make_image(fill_color="black", back_color="white")
-        temp_path = "temp_qr.png"
-        qr_image.save(temp_path)
+        # QR code identique déjà généré : réutilisation sans nouvel encodage
+        cached = self._qr_cache.get(mailto_link)
+        if cached is not None:
+            self._qr_cache.move_to_end(mailto_link)
+            self._on_qr_generated(cached[0], cached[1], match_data)
+            return
 
-        # === Affichage dans l'interface avec adaptation dynamique ===
-        pixmap = QPixmap(temp_path)
+        self.generate_btn.setEnabled(False)
+        self._qr_worker = QRGenWorker(mailto_link, match_data)
+        self._qr_worker.signals.finished.connect(self._on_qr_generated)
+        self._qr_worker.signals.failed.connect(self._on_qr_generation_failed)
+        QThreadPool.globalInstance().start(self._qr_worker)
 
-        # Calcul de la taille optimale pour le QR code selon l'espace disponible
-        # Le QR code s'adapte à la taille de la zone d'affichage
-        label_size = self.qr_label.size()
-        available_size = min(label_size.width() - 20, label_size.height() - 20)  # Marge de 20px
+    def _on_qr_generated(self, qimage, qr_image, match_data):
+        """
+        Affiche le QR code produit par QRGenWorker et termine la génération.
 
-        # Taille minimale de 200px, mais peut aller jusqu'à l'espace disponible
-        qr_size = max(200, min(available_size, 800))  # Maximum 800px même en très grand écran
+        Args:
+            qimage (QImage): Image du QR code pour l'affichage
+            qr_image: Image PIL du QR code (utilisée pour la sauvegarde PNG)
+            match_data (dict): Données du match (équipes, date, heure, clé)
+        """
+        self.generate_btn.setEnabled(True)
+
+        equipe1_raw = match_data["equipe1"]
+        equipe2_raw = match_data["equipe2"]
+        date = match_data["date"]
+        heure = match_data["heure"]
+        security_key = match_data["security_key"]
+
+        # Mémorisation du rendu (16 QR codes au plus, le moins récent est retiré)
+        self._qr_cache[match_data["mailto_link"]] = (qimage, qr_image)
+        self._qr_cache.move_to_end(match_data["mailto_link"])
+        if len(self._qr_cache) > 16:
+            self._qr_cache.popitem(last=False)
+
+        pixmap = QPixmap.fromImage(qimage)
+
+        # === Stockage de l'image originale pour le redimensionnement ===
+        # Les mises à l'échelle partent de la QImage (format natif du moteur raster),
+        # le pixmap reste utilisé pour l'agrandissement en popup
+        self.current_qr_qimage = qimage
+        self.current_qr_pixmap = pixmap
+        self.qr_module_count = qimage.width() // QR_BOX_SIZE
+        self._last_qr_size = None  # Nouveau QR code : mise à l'échelle à refaire
+        self._scaled_cache.clear()
 
-        scaled_pixmap = pixmap.scaled(qr_size, qr_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.qr_label.setPixmap(scaled_pixmap)
+        # === Affichage dans l'interface avec adaptation dynamique ===
+        # Le QR code s'adapte à la taille de la zone d'affichage
+        self.resize_qr_code()
 
         # === Information de sécurité (VOLONTAIREMENT sans afficher la clé) ===
         # Note sécurité: La clé n'est pas affichée pour éviter qu'elle soit vue sans scanner le QR code
         # Cela garantit que seul celui qui scanne le QR code a accès à la clé de vérification
         self.key_display.setText("🔐 Clé de sécurité intégrée dans le QR Code (non affichée pour des raisons de sécurité)\n\n💡 Cliquez sur le QR Code ci-dessus pour l'agrandir")
 
-        # === Stockage pour la sauvegarde et le redimensionnement ===
+        # === Stockage pour la sauvegarde ===
         self.current_qr_image = qr_image
-        self.current_qr_pixmap = pixmap  # Stockage du pixmap original pour redimensionnement
         self.current_match_info = f"{self.normalize_string(equipe1_raw)}_vs_{self.normalize_string(equipe2_raw)}_{date}_{heure.replace(':', 'h')}"
 
         # === Activation du bouton de sauvegarde ===
@@ -1311,11 +1877,21 @@ Merci."""
         # === Notification de succès ===
         QMessageBox.information(self, "Succès", "QR Code généré avec succès !")
 
+    def _on_qr_generation_failed(self, message):
+        """
+        Signale l'échec de la génération (ex: template trop long pour un QR code).
+
+        Args:
+            message (str): Description de l'erreur
+        """
+        self.generate_btn.setEnabled(True)
+        QMessageBox.critical(self, "Erreur", f"Impossible de générer le QR Code :\n{message}")
+
     def add_to_history(self, equipe1, equipe2, date, heure, security_key):
         """
         Ajoute une nouvelle génération à l'historique.
 
-        SÉCURITÉ: La clé est sauvegardée dans le fichier JSON pour traçabilité,
+        SÉCURITÉ: La clé est sauvegardée dans le fichier d'historique pour traçabilité,
         mais n'est jamais affichée dans l'interface utilisateur.
 
         Args:
@@ -1325,27 +1901,32 @@ Merci."""
             heure (str): Heure du match
             security_key (str): Clé de sécurité générée (sauvegardée mais non affichée)
         """
-        entry = {
-            "timestamp": datetime.now().isoformat(),
+        now = datetime.now()
+        entry = _cache_history_timestamp({
+            "timestamp": now.isoformat(),
             "equipe1": equipe1.strip(),
             "equipe2": equipe2.strip(),
             "date": date,
             "heure": heure,
             "security_key": security_key,
             # Note: template_used supprimé selon les spécifications
-        }
+        }, now)
 
-        # Ajout en début de liste (plus récent en premier)
-        self.generation_history.append(entry)
-        self.save_history()
-        self.refresh_history()
+        # Ajout en fin de liste (affiché en premier : plus récent en premier)
+        # Insertion d'une seule ligne dans la vue si l'onglet est construit
+        if self.history_model is not None:
+            self.history_model.append_entry(entry)
+            self.update_stats()
+        else:
+            self.generation_history.append(entry)
+        self.append_history_entry(entry)
 
     def show_qr_popup(self):
         """
         Affiche le QR code dans une popup plein écran.
         Permet un affichage agrandi pour faciliter le scan.
         """
-        if not hasattr(self, 'current_qr_pixmap') or not self.current_qr_pixmap:
+        if self.current_qr_pixmap is None:
             QMessageBox.information(self, "Information", "Aucun QR Code à afficher.\nVeuillez d'abord générer un QR Code.")
             return
 
@@ -1406,25 +1987,61 @@ Merci."""
         expected_key = self.generate_security_key(equipe1, equipe2, date, heure)
 
         # === Comparaison et affichage du résultat ===
-        if key_to_check == expected_key:
+        # Comparaison en temps constant (ne révèle pas la position de la première différence)
+        is_valid = hmac.compare_digest(key_to_check.encode('utf-8'), expected_key.encode('utf-8'))
+        if is_valid:
             self.verification_result.setText("✅ CLÉ VALIDE")
-            self.verification_result.setObjectName("verifyValid")
+            self.verification_result.setProperty("state", "valid")
         else:
             self.verification_result.setText("❌ CLÉ INVALIDE")
-            self.verification_result.setObjectName("verifyInvalid")
+            self.verification_result.setProperty("state", "invalid")
 
-        # Réappliquer le style après changement d'objectName
-        self.verification_result.style().unpolish(self.verification_result)
+        # Réappliquer le style du seul label après changement de propriété
         self.verification_result.style().polish(self.verification_result)
 
         # === Affichage des détails dans la zone dédiée ===
+        # Rendu différé : le résultat principal s'affiche d'abord, la mise en page
+        # (plus coûteuse) de la zone de détails suit au prochain tour de boucle
+        verified_at = datetime.now()
+        QTimer.singleShot(0, lambda: self._render_verification_details(
+            is_valid, key_to_check, expected_key, equipe1, equipe2, date, heure, verified_at
+        ))
+
+        # Notification popup optionnelle pour les cas critiques
+        if not is_valid:
+            QMessageBox.warning(
+                self,
+                "Clé Invalide Détectée",
+                f"⚠️ ATTENTION: La clé fournie ne correspond pas au match.\n\n"
+                f"Cela peut indiquer:\n"
+                f"• Une erreur de saisie\n"
+                f"• Une tentative de fraude\n"
+                f"• Des données de match incorrectes\n\n"
+                f"Vérifiez attentivement les informations saisies."
+            )
+
+    def _render_verification_details(self, is_valid, key_to_check, expected_key,
+                                     equipe1, equipe2, date, heure, verified_at):
+        """
+        Remplit la zone de détails de la vérification.
+
+        Args:
+            is_valid (bool): Résultat de la vérification
+            key_to_check (str): Clé fournie
+            expected_key (str): Clé attendue (masquée à l'affichage)
+            equipe1 (str): Nom de la première équipe
+            equipe2 (str): Nom de la deuxième équipe
+            date (str): Date du match
+            heure (str): Heure du match
+            verified_at (datetime): Date et heure de la vérification
+        """
         # Afficher seulement les 4 derniers caractères de la clé attendue
         masked_expected_key = "******" + expected_key[-4:]  # Masque les 6 premiers, affiche les 4 derniers
 
         details_text = f"""DÉTAILS DE LA VÉRIFICATION
 {'='*50}
 
-📊 RÉSULTAT: {'✅ VALIDE' if key_to_check == expected_key else '❌ INVALIDE'}
+📊 RÉSULTAT: {'✅ VALIDE' if is_valid else '❌ INVALIDE'}
 
 🔑 CLÉS:
    • Clé fournie    : {key_to_check}
@@ -1436,24 +2053,11 @@ Merci."""
    • Date           : {date}
    • Heure          : {heure}
    
-🕐 Vérification effectuée le {datetime.now().strftime('%d/%m/%Y à %H:%M:%S')}
+🕐 Vérification effectuée le {verified_at.strftime('%d/%m/%Y à %H:%M:%S')}
         """
 
         self.verification_details.setPlainText(details_text)
 
-        # Notification popup optionnelle pour les cas critiques
-        if key_to_check != expected_key:
-            QMessageBox.warning(
-                self,
-                "Clé Invalide Détectée",
-                f"⚠️ ATTENTION: La clé fournie ne correspond pas au match.\n\n"
-                f"Cela peut indiquer:\n"
-                f"• Une erreur de saisie\n"
-                f"• Une tentative de fraude\n"
-                f"• Des données de match incorrectes\n\n"
-                f"Vérifiez attentivement les informations saisies."
-            )
-
     def reset_template(self):
         """
         Remet le template d'email à sa valeur par défaut.
@@ -1484,26 +2088,128 @@ Merci."""
 
     def load_history(self):
         """
-        Charge l'historique des générations depuis le fichier JSON.
+        Charge l'historique des générations depuis le fichier NDJSON.
+        À défaut, lit l'ancien historique au format JSON (tableau) ; sa conversion
+        est écrite par _on_history_loaded, sur le thread principal.
 
         Returns:
-            list: Liste des entrées d'historique
+            tuple: (liste des entrées d'historique, True si lue depuis l'ancien format)
+        """
+        # Ouverture directe plutôt que exists() + open() : un appel système de moins au démarrage
+        try:
+            with open(self.history_file, 'rb') as f:
+                history = []
+                for line in f:
+                    if not line.strip():
+                        continue
+                    # Ligne illisible (ex: écriture interrompue par un arrêt brutal) :
+                    # ignorée sans perdre le reste de l'historique
+                    try:
+                        history.append(_cache_history_timestamp(_load_history_line(line)))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                return history, False
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            return [], False
+
+        # Ancien format (tableau JSON complet), converti après le chargement
+        try:
+            with open(self.legacy_history_file, 'rb') as f:
+                history = json.load(f)
+            return [_cache_history_timestamp(entry) for entry in history], True
+        except Exception as e:
+            return [], False
+
+    def _on_history_loaded(self, history, from_legacy):
+        """
+        Reçoit l'historique chargé en arrière-plan et rafraîchit l'affichage.
+
+        Args:
+            history (list): Entrées lues depuis le fichier d'historique
+            from_legacy (bool): Entrées lues depuis l'ancien fichier JSON
+        """
+        # Historique vidé pendant le chargement : les entrées lues sont obsolètes
+        # (la réécriture du fichier est déjà programmée par clear_history)
+        if self._history_cleared:
+            return
+
+        # Conserve les générations effectuées pendant le chargement
+        pending = [entry for entry in self.generation_history if entry not in history]
+        self.generation_history = history + pending
+
+        # Conversion de l'ancien format : réécriture complète sur le thread principal,
+        # seul à écrire dans le fichier (les ajouts en cours y sont inclus)
+        if from_legacy:
+            self._history_dirty = True
+            self.save_history()
+
+        self.refresh_history()
+
+    def append_history_entry(self, entry):
+        """
+        Ajoute une seule entrée en fin de fichier d'historique.
+        Le fichier reste ouvert entre deux ajouts ; chaque entrée est écrite
+        physiquement sur le disque pour survivre à un arrêt brutal.
+
+        Args:
+            entry (dict): Entrée d'historique à ajouter
+        """
+        try:
+            if self._history_handle is None:
+                handle = open(self.history_file, 'a+b')
+                # Dernière ligne incomplète (écriture interrompue) : on la termine
+                # pour que la nouvelle entrée ne soit pas collée au fragment
+                if handle.seek(0, os.SEEK_END) > 0:
+                    handle.seek(-1, os.SEEK_END)
+                    if handle.read(1) != b"\n":
+                        handle.write(b"\n")
+                self._history_handle = handle
+            self._history_handle.write(_dump_history_line(entry))
+            self._history_handle.flush()
+            os.fsync(self._history_handle.fileno())
+        except Exception as e:
+            pass
+
+    def close_history_file(self, sync=False):
         """
+        Ferme le fichier d'historique ouvert en ajout.
+
+        Args:
+            sync (bool): Force l'écriture physique sur le disque (os.fsync)
+        """
+        if self._history_handle is None:
+            return
         try:
-            if Path(self.history_file).exists():
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            if sync:
+                self._history_handle.flush()
+                os.fsync(self._history_handle.fileno())
+            self._history_handle.close()
         except Exception as e:
             pass
-        return []
+        self._history_handle = None
 
     def save_history(self):
         """
-        Sauvegarde l'historique des générations dans le fichier JSON.
+        Réécrit entièrement le fichier d'historique NDJSON, si nécessaire.
+        Utilisée uniquement pour les modifications globales (vidage).
+        L'écriture passe par un fichier temporaire pour ne jamais laisser
+        un historique tronqué en cas d'interruption.
         """
+        # Aucune modification globale en attente : rien à réécrire
+        if not self._history_dirty:
+            return
+
+        self.close_history_file()
+        temp_file = self.history_file + ".tmp"
         try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.generation_history, f, indent=2, ensure_ascii=False)
+            with open(temp_file, 'wb') as f:
+                f.writelines(_dump_history_line(entry) for entry in self.generation_history)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.history_file)
+            self._history_dirty = False
         except Exception as e:
             pass
 
@@ -1514,27 +2220,11 @@ Merci."""
         SÉCURITÉ: Les clés de sécurité ne sont volontairement pas affichées
         pour maintenir la sécurité du système et l'utilité de l'onglet vérification.
         """
-        self.history_table.setRowCount(len(self.generation_history))
-
-        # Affichage en ordre inverse (plus récent en premier)
-        for row, entry in enumerate(reversed(self.generation_history)):
-            # Colonne 0: Date/Heure de génération
-            timestamp = datetime.fromisoformat(entry["timestamp"])
-            self.history_table.setItem(row, 0, QTableWidgetItem(
-                timestamp.strftime("%d/%m/%Y %H:%M")
-            ))
-
-            # Colonne 1: Équipe 1
-            self.history_table.setItem(row, 1, QTableWidgetItem(entry["equipe1"]))
-
-            # Colonne 2: Équipe 2
-            self.history_table.setItem(row, 2, QTableWidgetItem(entry["equipe2"]))
-
-            # Colonne 3: Date et heure du match
-            match_info = f"{entry['date']} {entry['heure']}"
-            self.history_table.setItem(row, 3, QTableWidgetItem(match_info))
+        # Onglet pas encore construit : il sera rempli à sa première ouverture
+        if self.history_model is None:
+            return
 
-            # Note: Clé de sécurité volontairement omise pour des raisons de sécurité
+        self.history_model.set_entries(self.generation_history)
 
         # Mise à jour des statistiques
         self.update_stats()
@@ -1553,7 +2243,10 @@ Merci."""
 
         if reply == QMessageBox.Yes:
             self.generation_history = []
-            self.save_history()
+            self._history_cleared = True
+            # Réécriture du fichier regroupée avec la prochaine sauvegarde différée
+            self._history_dirty = True
+            self.save_timer.start()
             self.refresh_history()
             QMessageBox.information(self, "Succès", "Historique vidé avec succès.")
 
@@ -1562,27 +2255,43 @@ Merci."""
         Met à jour l'affichage des statistiques d'utilisation.
         """
         total = len(self.generation_history)
-        today = datetime.now().date()
+        today_epoch = int(datetime.combine(datetime.now().date(), datetime.min.time()).timestamp())
 
-        # Comptage des générations du jour
+        # Comptage des générations du jour (comparaison d'entiers, sans objet date)
         today_count = sum(1 for entry in self.generation_history
-                          if datetime.fromisoformat(entry["timestamp"]).date() == today)
+                          if entry["_ts_epoch"] >= today_epoch)
 
         self.stats_label.setText(f"📊 Total: {total} QR codes générés | Aujourd'hui: {today_count}")
 
+    def save_pending_changes(self):
+        """
+        Sauvegarde différée déclenchée par le timer :
+        paramètres de l'interface et, si nécessaire, historique complet.
+        """
+        self.save_current_settings()
+        self.save_history()
+
     def save_current_settings(self):
         """
         Sauvegarde automatique des paramètres actuels dans QSettings.
         Appelée automatiquement lors des modifications de l'interface.
         """
+        # Aucune modification depuis la dernière sauvegarde (cas courant à la fermeture)
+        if not self._settings_dirty:
+            return
+        self._settings_dirty = False
+
         # Sauvegarde des champs du formulaire avec strip automatique
         self.settings.setValue("equipe1", self.equipe1_input.text().strip())
         self.settings.setValue("equipe2", self.equipe2_input.text().strip())
         self.settings.setValue("date", self.date_input.date())
         self.settings.setValue("heure", self.heure_input.time())
 
-        # Sauvegarde du template personnalisé
-        self.settings.setValue("email_template", self.email_template.toPlainText())
+        # Sauvegarde du template personnalisé, seulement s'il a été modifié
+        # (évite d'extraire et de comparer tout le texte à chaque sauvegarde)
+        if self._template_dirty:
+            self.settings.setValue("email_template", self.email_template.toPlainText())
+            self._template_dirty = False
 
     def load_settings(self):
         """
@@ -1619,37 +2328,77 @@ Merci."""
         super().resizeEvent(event)
 
         # Redimensionnement du QR code si un QR code est affiché
-        if hasattr(self, 'current_qr_pixmap') and self.current_qr_pixmap:
+        # (au plus proche voisin, donc assez rapide pour suivre le glissement)
+        if self.current_qr_pixmap is not None:
             self.resize_qr_code()
 
     def resize_qr_code(self):
         """
         Redimensionne le QR code affiché selon l'espace disponible.
-        Appelée lors du redimensionnement de la fenêtre.
+        Appelée à la génération et lors du redimensionnement de la fenêtre.
+
+        La taille est un multiple entier du nombre de modules : chaque module
+        occupe un nombre entier de pixels et l'interpolation au plus proche
+        voisin donne un résultat net, sans passage lissé coûteux.
         """
-        if not hasattr(self, 'current_qr_pixmap') or not self.current_qr_pixmap:
+        if self.current_qr_pixmap is None:
             return
 
         # Calcul de la taille optimale selon l'espace disponible
+        # (une seule lecture de la taille du label)
         label_size = self.qr_label.size()
-        available_size = min(label_size.width() - 40, label_size.height() - 40)  # Marge de 40px
+        label_width, label_height = label_size.width(), label_size.height()
+        available_size = (label_width if label_width < label_height else label_height) - 40  # Marge de 40px
 
         # Taille minimale de 200px, mais peut aller jusqu'à l'espace disponible
-        qr_size = max(200, min(available_size, 800))  # Maximum 800px même en très grand écran
+        # Maximum 800px même en très grand écran
+        qr_size = 200 if available_size < 200 else (800 if available_size > 800 else available_size)
 
-        # Redimensionnement et affichage
-        scaled_pixmap = self.current_qr_pixmap.scaled(
-            qr_size, qr_size, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
+        # Alignement sur un nombre entier de pixels par module (au moins 200px)
+        modules = self.qr_module_count
+        qr_size -= qr_size % modules
+        if qr_size < 200:
+            qr_size += modules
+
+        # Taille inchangée : rien à recalculer
+        if qr_size == self._last_qr_size:
+            return
+        self._last_qr_size = qr_size
+
+        # Taille quasi identique à l'original : affichage direct, sans mise à l'échelle
+        if abs(qr_size - self.current_qr_pixmap.width()) <= 2:
+            self.qr_label.setPixmap(self.current_qr_pixmap)
+            return
+
+        # Taille déjà calculée lors d'un redimensionnement précédent
+        cached_pixmap = self._scaled_cache.get(qr_size)
+        if cached_pixmap is not None:
+            self.qr_label.setPixmap(cached_pixmap)
+            return
+
+        # Redimensionnement (depuis la QImage, sans aller-retour pixmap -> image) et affichage
+        scaled_pixmap = QPixmap.fromImage(self.current_qr_qimage.scaled(
+            qr_size, qr_size, Qt.KeepAspectRatio, Qt.FastTransformation
+        ))
         self.qr_label.setPixmap(scaled_pixmap)
 
+        # Cache limité à 8 tailles (la plus ancienne est retirée en premier)
+        if len(self._scaled_cache) >= 8:
+            del self._scaled_cache[next(iter(self._scaled_cache))]
+        self._scaled_cache[qr_size] = scaled_pixmap
+
     def closeEvent(self, event):
         """
         Événement appelé à la fermeture de l'application.
         Sauvegarde automatiquement les derniers paramètres.
         """
-        # Sauvegarde finale des paramètres
-        self.save_current_settings()
+        # Sauvegarde finale des paramètres (et de l'historique en attente)
+        self.save_timer.stop()
+        self.save_pending_changes()
+        self.settings.sync()
+
+        # Écriture définitive de l'historique sur le disque
+        self.close_history_file(sync=True)
         event.accept()
 
 def main():